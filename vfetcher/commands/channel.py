@@ -1,34 +1,50 @@
 import logging
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import typer
-from yt_dlp import YoutubeDL
 
-from vfetcher.utils import create_progress, download_videos, filter_already_downloaded
+from vfetcher.utils import (
+    create_progress,
+    download_videos,
+    filter_already_downloaded,
+    get_ydl_opts,
+)
+
+if TYPE_CHECKING:
+    from yt_dlp import YoutubeDL
 
 logger = logging.getLogger(__name__)
 
 
-def get_channel_video_urls(channel_url: str, limit: int | None = None) -> list[str]:
-    """Fetch video URLs from a YouTube channel."""
+def get_channel_video_urls(
+    ydl: "YoutubeDL", channel_url: str, limit: int | None = None
+) -> list[str]:
+    """Fetch video URLs from a YouTube channel.
+
+    Listing options are applied to `ydl` only for the duration of the call, so
+    the same instance can be used for the downloads afterwards.
+    """
     # Ensure we're fetching from the videos tab
     if not channel_url.endswith("/videos"):
         channel_url = channel_url.rstrip("/") + "/videos"
 
-    ydl_opts: dict[str, Any] = {
+    listing_params: dict[str, Any] = {
         "extract_flat": "in_playlist",
         "quiet": True,
+        "playlistend": limit or None,
     }
-    if limit:
-        ydl_opts["playlistend"] = limit
-
-    with YoutubeDL(ydl_opts) as ydl:  # type: ignore[arg-type]
+    saved_params = {key: ydl.params.get(key) for key in listing_params}
+    ydl.params.update(listing_params)
+    try:
         info = ydl.extract_info(channel_url, download=False)
-        if info is None:
-            return []
-        entries = info.get("entries", [])
-        return [entry["url"] for entry in entries if entry and entry.get("url")]
+    finally:
+        ydl.params.update(saved_params)
+
+    if info is None:
+        return []
+    entries = info.get("entries", [])
+    return [entry["url"] for entry in entries if entry and entry.get("url")]
 
 
 def channel(
@@ -66,6 +82,18 @@ def channel(
         "-j",
         help="Random jitter range added to delay (0 to jitter seconds).",
     ),
+    concurrency: int = typer.Option(
+        3,
+        "--concurrency",
+        "-c",
+        min=1,
+        help="Number of videos to download in parallel.",
+    ),
+    remux: bool = typer.Option(
+        True,
+        "--remux/--no-remux",
+        help="Remux downloads that are not MP4 into MP4 with ffmpeg.",
+    ),
 ):
     """
     Downloads videos from a YouTube channel.
@@ -77,27 +105,45 @@ def channel(
 
     out.mkdir(parents=True, exist_ok=True)
 
-    logger.info("Fetching video list from channel...")
-    video_urls = get_channel_video_urls(url, limit)
-    logger.info(f"Found {len(video_urls)} videos in channel.")
-
-    if not video_urls:
-        logger.warning("No videos found in channel.")
-        return
-
-    video_urls_to_download, skipped_count = filter_already_downloaded(video_urls, out)
-
-    if skipped_count > 0:
-        logger.info(f"Skipped {skipped_count} videos that were already downloaded.")
-
-    if not video_urls_to_download:
-        logger.info("All videos already downloaded.")
-        return
-
-    logger.info(f"Proceeding to download {len(video_urls_to_download)} new videos.")
-
-    with create_progress() as progress:
-        result = download_videos(video_urls_to_download, out, progress, delay, jitter)
+    from yt_dlp import YoutubeDL
+
+    # One instance serves both the listing and the downloads, so the connection
+    # to YouTube and the extractor state are reused for the first video
+    with YoutubeDL(get_ydl_opts(out)) as ydl:  # type: ignore[arg-type]
+        logger.info("Fetching video list from channel...")
+        video_urls = get_channel_video_urls(ydl, url, limit)
+        logger.info(f"Found {len(video_urls)} videos in channel.")
+
+        if not video_urls:
+            logger.warning("No videos found in channel.")
+            return
+
+        video_urls_to_download, skipped_count = filter_already_downloaded(
+            video_urls, out
+        )
+
+        if skipped_count > 0:
+            logger.info(
+                f"Skipped {skipped_count} videos that were already downloaded or listed twice."
+            )
+
+        if not video_urls_to_download:
+            logger.info("All videos already downloaded.")
+            return
+
+        logger.info(f"Proceeding to download {len(video_urls_to_download)} new videos.")
+
+        with create_progress() as progress:
+            result = download_videos(
+                video_urls_to_download,
+                out,
+                progress,
+                delay,
+                jitter,
+                concurrency,
+                ydl=ydl,
+                remux=remux,
+            )
 
     logger.info(
         f"Done. Success: {result.success_count}, Failed: {result.failure_count}, Skipped: {skipped_count}"
@@ -42,6 +42,18 @@ def download(
         "-j",
         help="Random jitter range added to delay (0 to jitter seconds).",
     ),
+    concurrency: int = typer.Option(
+        3,
+        "--concurrency",
+        "-c",
+        min=1,
+        help="Number of videos to download in parallel.",
+    ),
+    remux: bool = typer.Option(
+        True,
+        "--remux/--no-remux",
+        help="Remux downloads that are not MP4 into MP4 with ffmpeg.",
+    ),
 ):
     """
     Downloads YouTube videos from a list of IDs.
@@ -51,13 +63,16 @@ def download(
 
     out.mkdir(parents=True, exist_ok=True)
 
-    video_ids = [vid.strip() for vid in ids.read_text().splitlines() if vid.strip()]
+    with ids.open("r", encoding="utf-8") as f:
+        video_ids = [vid for vid in (line.strip() for line in f) if vid]
     logger.info(f"Found {len(video_ids)} video IDs to process.")
 
     video_urls_to_download, skipped_count = filter_already_downloaded(video_ids, out)
 
     if skipped_count > 0:
-        logger.info(f"Skipped {skipped_count} videos that were already downloaded.")
+        logger.info(
+            f"Skipped {skipped_count} videos that were already downloaded or listed twice."
+        )
 
     if not video_urls_to_download:
         logger.info("No new videos to download.")
@@ -66,7 +81,15 @@ def download(
     logger.info(f"Proceeding to download {len(video_urls_to_download)} new videos.")
 
     with create_progress() as progress:
-        result = download_videos(video_urls_to_download, out, progress, delay, jitter)
+        result = download_videos(
+            video_urls_to_download,
+            out,
+            progress,
+            delay,
+            jitter,
+            concurrency,
+            remux=remux,
+        )
 
     logger.info(
         f"Done. Success: {result.success_count}, Failed: {result.failure_count}, Skipped: {skipped_count}"
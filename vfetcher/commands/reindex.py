@@ -0,0 +1,29 @@
+import logging
+from pathlib import Path
+
+import typer
+
+from vfetcher.utils import rebuild_video_index
+
+logger = logging.getLogger(__name__)
+
+
+def reindex(
+    out: Path = typer.Option(
+        "outputs/default",
+        "--out",
+        "-o",
+        help="The directory whose index of downloaded videos to rebuild.",
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+        writable=True,
+        resolve_path=True,
+    ),
+):
+    """
+    Rebuilds the index of downloaded videos from the files in a directory.
+    """
+    logger.info(f"Rebuilding video index in: {out}")
+    video_ids = rebuild_video_index(out)
+    logger.info(f"Done. Indexed {len(video_ids)} downloaded videos.")
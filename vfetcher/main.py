@@ -5,10 +5,12 @@ import typer
 
 from vfetcher.commands.channel import channel
 from vfetcher.commands.download import download
+from vfetcher.commands.reindex import reindex
 
 app = typer.Typer()
 app.command()(download)
 app.command()(channel)
+app.command()(reindex)
 
 
 if __name__ == "__main__":
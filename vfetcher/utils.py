@@ -1,41 +1,67 @@
 import logging
+import os
+import queue
 import random
 import re
+import socket
+import subprocess
+import sys
+import threading
 import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
-from urllib.parse import parse_qs, urlparse
-
-from rich.progress import (
-    BarColumn,
-    DownloadColumn,
-    Progress,
-    SpinnerColumn,
-    TextColumn,
-    TimeRemainingColumn,
-    TransferSpeedColumn,
-)
-from yt_dlp import YoutubeDL
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlparse
+
+# yt-dlp and rich.progress are slow to import, so they are only loaded when
+# needed to keep `--help` and argument errors fast
+if TYPE_CHECKING:
+    from rich.progress import Progress, TaskID
+    from yt_dlp import YoutubeDL
 
 logger = logging.getLogger(__name__)
 
+_VIDEO_ID_RE = re.compile(r"-([a-zA-Z0-9_-]{11})\.")
+_ID_INDEX_FILENAME = ".vfetcher_ids.txt"
+# yt-dlp's in-progress and leftover files, which must not count as downloaded:
+# partial downloads, fragment temp files and unmerged per-format files
+_PARTIAL_SUFFIXES = (".part", ".ytdl")
+_FRAGMENT_MARKER = ".part-Frag"
+_FORMAT_FILE_RE = re.compile(r"\.f\d+\.\w+$")
+# Matches youtube.com/watch?...v=<id> and youtu.be/<id> URLs. Like urlparse,
+# scheme and host are case-insensitive, and IDs must be exactly 11 characters
+_YT_ID_RE = re.compile(
+    r"(?:(?i:https?://(?:www\.)?youtube\.com)/watch\?(?:[^#]*&)?v="
+    r"|(?i:https?://youtu\.be)/)"
+    r"([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])"
+)
+_YT_WATCH = sys.intern("https://www.youtube.com/watch?v=")
+_WARMUP_HOSTS = ("www.youtube.com",)
+_PROGRESS_REFRESH_RATE = 4
+_PROGRESS_UPDATE_INTERVAL = 1 / _PROGRESS_REFRESH_RATE
+
+
+# Options shared by every download; `get_ydl_opts` fills in the per-call ones
+_YDL_TEMPLATE: dict[str, Any] = {
+    "format": "bestvideo[ext=mp4][height<=1080]+bestaudio[ext=m4a]/best[ext=mp4]/best",
+    "noplaylist": True,
+    # Keep connections to the CDN open between fragments and videos
+    "http_headers": {"Connection": "keep-alive"},
+    # Fetch DASH/HLS fragments in parallel
+    "concurrent_fragment_downloads": 4,
+    "logger": logger,
+}
+
 
 def get_ydl_opts(output_dir: Path) -> dict[str, Any]:
     """Returns common yt-dlp options."""
-    return {
-        "format": "bestvideo[ext=mp4][height<=1080]+bestaudio[ext=m4a]/best[ext=mp4]/best",
-        "outtmpl": str(output_dir / "%(title)s-%(id)s.%(ext)s"),
-        "noplaylist": True,
-        "progress_hooks": [],
-        "postprocessors": [
-            {
-                "key": "FFmpegVideoConvertor",
-                "preferedformat": "mp4",
-            }
-        ],
-        "logger": logger,
-    }
+    opts = _YDL_TEMPLATE.copy()
+    opts["outtmpl"] = str(output_dir / "%(title)s-%(id)s.%(ext)s")
+    opts["progress_hooks"] = []
+    return opts
 
 
 def extract_video_id(vid: str) -> str:
@@ -43,58 +69,150 @@ def extract_video_id(vid: str) -> str:
     if not vid.startswith("http"):
         return vid
 
-    parsed_url = urlparse(vid)
-    if (
-        parsed_url.hostname in ["www.youtube.com", "youtube.com"]
-        and parsed_url.path == "/watch"
-    ):
-        query_params = parse_qs(parsed_url.query)
-        return query_params.get("v", [vid])[0]
-    elif parsed_url.hostname == "youtu.be":
-        return parsed_url.path[1:]
-    return vid
+    match = _YT_ID_RE.match(vid)
+    return match.group(1) if match else vid
 
 
-def get_downloaded_video_ids(output_dir: Path) -> set[str]:
+def get_downloaded_video_ids(output_dir: Path) -> frozenset[str]:
     """
-    Scans the output directory for already downloaded video files and extracts their IDs.
+    Returns the IDs of videos already downloaded to the output directory.
+
+    IDs are read from the index file in the directory, which `download_videos`
+    appends to after every download. The directory itself is only scanned when
+    it may have changed since the index was last written, and only IDs missing
+    from the index are added. Use `rebuild_video_index` to drop videos deleted
+    since.
     """
+    return _scan_ids(str(output_dir), os.stat(output_dir).st_mtime_ns)
+
+
+@lru_cache(maxsize=16)
+def _scan_ids(output_dir: str, mtime_ns: int) -> frozenset[str]:
+    """Reads the index of `output_dir`, adding any videos it does not list yet."""
+    index_path = os.path.join(output_dir, _ID_INDEX_FILENAME)
+    downloaded_ids: set[str] = set()
+    index_mtime_ns = -1
+    try:
+        with open(index_path, encoding="utf-8") as f:
+            index_mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+            downloaded_ids.update(line.strip() for line in f)
+        downloaded_ids.discard("")
+    except FileNotFoundError:
+        pass
+
+    # Rescan on a tie too, since a change in the same timestamp tick as the last
+    # index write leaves both times equal
+    if mtime_ns >= index_mtime_ns:
+        new_ids = _scan_dir(output_dir) - downloaded_ids
+        try:
+            _append_to_index(index_path, new_ids)
+            # Mark the index as up to date even if nothing new was found
+            os.utime(index_path)
+        except OSError as e:
+            logger.debug(f"Could not update video index {index_path}: {e}")
+        downloaded_ids |= new_ids
+
+    return frozenset(downloaded_ids)
+
+
+def _scan_dir(output_dir: str) -> set[str]:
+    """Scans `output_dir` for video files and extracts their IDs."""
     downloaded_ids = set()
-    video_id_pattern = r"-([a-zA-Z0-9_-]{11})\."
-    for file_path in output_dir.iterdir():
-        if file_path.is_file():
-            match = re.search(video_id_pattern, file_path.name)
-            if match:
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if (
+                name.endswith(_PARTIAL_SUFFIXES)
+                or _FRAGMENT_MARKER in name
+                or _FORMAT_FILE_RE.search(name)
+            ):
+                continue
+            # Match the name first, so is_file() only runs for likely videos.
+            # It uses the file type cached by readdir, so only symlinks need
+            # an extra stat call
+            match = _VIDEO_ID_RE.search(name)
+            if match and entry.is_file():
                 downloaded_ids.add(match.group(1))
     return downloaded_ids
 
 
+def _append_to_index(index_path: str, video_ids: Iterable[str]) -> None:
+    """Appends `video_ids` to the index file, one per line."""
+    with open(index_path, "a", encoding="utf-8") as f:
+        for video_id in video_ids:
+            f.write(f"{video_id}\n")
+
+
+def rebuild_video_index(output_dir: Path) -> frozenset[str]:
+    """Regenerates the index of downloaded videos from the files in `output_dir`."""
+    downloaded_ids = _scan_dir(str(output_dir))
+    with open(output_dir / _ID_INDEX_FILENAME, "w", encoding="utf-8") as f:
+        for video_id in sorted(downloaded_ids):
+            f.write(f"{video_id}\n")
+    _scan_ids.cache_clear()
+    return frozenset(downloaded_ids)
+
+
 def filter_already_downloaded(
     video_ids: list[str], output_dir: Path
 ) -> tuple[list[str], int]:
-    """Filter out already downloaded videos and return URLs to download."""
+    """Filter out already downloaded videos and return URLs to download.
+
+    Videos listed more than once, e.g. as both a watch and a youtu.be URL, are
+    only kept the first time and count as skipped.
+    """
     downloaded_ids = get_downloaded_video_ids(output_dir)
     logger.info(f"Found {len(downloaded_ids)} videos already downloaded in {output_dir}.")
 
-    video_urls_to_download = []
-    skipped_count = 0
-
-    for vid in video_ids:
-        actual_id = extract_video_id(vid)
-        if actual_id in downloaded_ids:
-            logger.info(f"Skipping {vid} (ID: {actual_id}) as it is already downloaded.")
-            skipped_count += 1
-        else:
-            if vid.startswith("http"):
-                video_urls_to_download.append(vid)
-            else:
-                video_urls_to_download.append(f"https://www.youtube.com/watch?v={vid}")
+    # Bind to locals to skip global and attribute lookups in the loops below
+    _extract = extract_video_id
+    _startswith = str.startswith
+    if logger.isEnabledFor(logging.DEBUG):
+        listed: set[str] = set()
+        for vid in video_ids:
+            if (actual_id := _extract(vid)) in downloaded_ids:
+                logger.debug(
+                    "Skipping %s (ID: %s) as it is already downloaded.", vid, actual_id
+                )
+            elif actual_id in listed:
+                logger.debug(
+                    "Skipping %s (ID: %s) as it is listed more than once.",
+                    vid,
+                    actual_id,
+                )
+            listed.add(actual_id)
+
+    # Concurrent downloads of the same video would write to the same files, so
+    # keep only the first URL per ID (set.add returns None, marking it as seen)
+    seen: set[str] = set()
+    _seen_add = seen.add
+    video_urls_to_download = [
+        vid if _startswith(vid, "http") else _YT_WATCH + vid
+        for vid in video_ids
+        if (actual_id := _extract(vid)) not in downloaded_ids
+        and actual_id not in seen
+        and not _seen_add(actual_id)
+    ]
+    skipped_count = len(video_ids) - len(video_urls_to_download)
+    # Group URLs by host so consecutive downloads reuse pooled connections. The
+    # sort is stable, so the input order is kept within each host
+    video_urls_to_download.sort(key=lambda url: urlparse(url).hostname or "")
 
     return video_urls_to_download, skipped_count
 
 
-def create_progress() -> Progress:
+def create_progress() -> "Progress":
     """Create a Rich progress bar instance."""
+    from rich.progress import (
+        BarColumn,
+        DownloadColumn,
+        Progress,
+        SpinnerColumn,
+        TextColumn,
+        TimeRemainingColumn,
+        TransferSpeedColumn,
+    )
+
     return Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -102,10 +220,11 @@ def create_progress() -> Progress:
         DownloadColumn(),
         TransferSpeedColumn(),
         TimeRemainingColumn(),
+        refresh_per_second=_PROGRESS_REFRESH_RATE,
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class DownloadResult:
     """Result of a download operation."""
 
@@ -114,12 +233,97 @@ class DownloadResult:
     failed_urls: list[str]
 
 
+@dataclass(slots=True)
+class _ProgressState:
+    """Progress of the file a video download is currently on."""
+
+    task_id: "TaskID"
+    filename: str | None = None
+    downloaded: int = 0
+    last_update: float = 0.0
+
+
+def _warm_dns(hosts: Iterable[str]) -> None:
+    """Resolves `hosts` in the background so a caching resolver has them ready."""
+
+    def _resolve() -> None:
+        for host in hosts:
+            try:
+                socket.getaddrinfo(host, 443, type=socket.SOCK_STREAM)
+            except OSError as e:
+                logger.debug(f"Could not resolve {host}: {e}")
+
+    threading.Thread(target=_resolve, name="dns-warmup", daemon=True).start()
+
+
+class Remuxer:
+    """Remuxes finished downloads into MP4 with ffmpeg on a background thread.
+
+    Running ffmpeg outside yt-dlp's postprocessing lets the next download start
+    while the previous one is still being remuxed.
+    """
+
+    def __init__(self) -> None:
+        self._queue: queue.Queue[str | None] = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="remuxer", daemon=True)
+        self._thread.start()
+
+    def submit(self, filename: str) -> None:
+        """Queues a downloaded file for remuxing unless it is already MP4."""
+        if not filename.endswith(".mp4"):
+            self._queue.put(filename)
+
+    def close(self) -> None:
+        """Waits for all queued files to be remuxed and stops the thread."""
+        self._queue.join()
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while (filename := self._queue.get()) is not None:
+            try:
+                _remux_to_mp4(Path(filename))
+            except Exception as e:
+                # Keep the thread alive, or close() would wait forever
+                logger.warning(f"Failed to remux {filename}: {e}")
+            finally:
+                self._queue.task_done()
+
+
+def _remux_to_mp4(src: Path) -> None:
+    """Copies the streams of `src` into an MP4 container and removes `src`."""
+    dst = src.with_suffix(".mp4")
+    tmp = src.with_suffix(".temp.mp4")
+    logger.debug(f"Remuxing {src} into MP4...")
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-y", "-loglevel", "error", "-i", str(src), "-c", "copy", tmp],
+            capture_output=True,
+            text=True,
+        )
+    except OSError as e:
+        logger.warning(f"Failed to run ffmpeg for {src}: {e}")
+        return
+    if result.returncode != 0:
+        logger.warning(f"Failed to remux {src}: {result.stderr.strip()}")
+        tmp.unlink(missing_ok=True)
+        return
+    try:
+        tmp.replace(dst)
+        src.unlink()
+    except OSError as e:
+        logger.warning(f"Failed to replace {src} with its MP4 remux: {e}")
+
+
 def download_videos(
     video_urls: list[str],
     output_dir: Path,
-    progress: Progress,
+    progress: "Progress",
     delay: float = 2.0,
     jitter: float = 1.0,
+    concurrency: int = 3,
+    ydl: "YoutubeDL | None" = None,
+    remux: bool = True,
 ) -> DownloadResult:
     """Download a list of videos with progress tracking.
 
@@ -127,14 +331,33 @@ def download_videos(
         video_urls: List of video URLs to download.
         output_dir: Directory to save downloaded videos.
         progress: Rich Progress instance for display.
-        delay: Base delay between downloads in seconds.
+        delay: Base delay between download starts in seconds, applied per worker.
         jitter: Random jitter range (0 to jitter) added to delay.
+        concurrency: Number of videos to download in parallel.
+        ydl: Optional YoutubeDL instance to reuse for downloads, e.g. the one
+            that listed the videos. It is left open for the caller to close.
+        remux: Whether to remux downloads that are not MP4 into MP4.
 
     Returns:
         DownloadResult with success/failure counts and failed URLs.
     """
-    ydl_opts = get_ydl_opts(output_dir)
-    current_task_id = None
+    # Overlap the first DNS lookup with building the YoutubeDL instances
+    _warm_dns(_WARMUP_HOSTS)
+    from rich.markup import escape
+    from yt_dlp import YoutubeDL
+    from yt_dlp.utils import DownloadCancelled
+
+    concurrency = max(1, concurrency)
+    # Paces the downloads of each worker thread
+    local = threading.local()
+    # Fragmented downloads call the progress hook from yt-dlp's own threads, so
+    # progress state is looked up by video ID instead of by worker thread
+    progress_states: dict[str, _ProgressState] = {}
+    progress_lock = threading.Lock()
+    index_path = os.path.join(output_dir, _ID_INDEX_FILENAME)
+    index_lock = threading.Lock()
+    # Set on Ctrl-C so running downloads abort at their next progress event
+    cancelled = threading.Event()
     success_count = 0
     failed_urls: list[str] = []
 
@@ -143,52 +366,147 @@ def download_videos(
     )
 
     def download_progress_hook(d):
-        nonlocal current_task_id
-        if current_task_id is None:
-            return
-        if d["status"] == "downloading":
-            if d.get("total_bytes"):
-                progress.update(
-                    current_task_id,
-                    completed=d["downloaded_bytes"],
-                    total=d["total_bytes"],
-                )
-            elif d.get("total_bytes_estimate"):
+        if cancelled.is_set():
+            raise DownloadCancelled("Interrupted by user")
+        video_id = (d.get("info_dict") or {}).get("id")
+        with progress_lock:
+            state = progress_states.get(video_id)
+            if state is None:
+                return
+            if d["status"] == "downloading":
+                if d.get("filename") != state.filename:
+                    total = d.get("total_bytes") or d.get("total_bytes_estimate")
+                    if not total:
+                        return
+                    # A new file (e.g. the audio after the video stream) restarts
+                    # the bar
+                    state.filename = d.get("filename")
+                    state.downloaded = 0
+                    progress.update(state.task_id, completed=0, total=total)
+
+                # yt-dlp reports every chunk, so coalesce updates to the refresh rate
+                now = time.monotonic()
+                if now - state.last_update < _PROGRESS_UPDATE_INTERVAL:
+                    return
+                downloaded = d["downloaded_bytes"]
+                progress.update(state.task_id, advance=downloaded - state.downloaded)
+                state.downloaded = downloaded
+                state.last_update = now
+            elif d["status"] == "finished":
                 progress.update(
-                    current_task_id,
-                    completed=d["downloaded_bytes"],
-                    total=d["total_bytes_estimate"],
+                    state.task_id,
+                    completed=d.get("total_bytes") or d.get("total_bytes_estimate", 0),
+                    refresh=True,
                 )
-        elif d["status"] == "finished":
-            progress.update(
-                current_task_id,
-                completed=d.get("total_bytes") or d.get("total_bytes_estimate", 0),
-                refresh=True,
-            )
 
-    ydl_opts["progress_hooks"].append(download_progress_hook)
+    remuxer = Remuxer() if remux else None
 
-    for i, video_url in enumerate(video_urls):
-        current_task_id = progress.add_task(
-            f"[cyan]Downloading {video_url}", start=False
-        )
+    # yt-dlp is not thread-safe, so instances (and the params dicts they keep
+    # and rewrite) are never shared between concurrent downloads. Idle ones are
+    # reused for the next URL to keep extractor state and HTTP connections warm.
+    idle_ydls: queue.SimpleQueue[YoutubeDL] = queue.SimpleQueue()
+    created_ydls: list[YoutubeDL] = []
+    if ydl is not None:
+        ydl.add_progress_hook(download_progress_hook)
+        if remuxer is not None:
+            ydl.add_post_hook(remuxer.submit)
+        idle_ydls.put(ydl)
+
+    def _acquire_ydl() -> "YoutubeDL":
         try:
-            with YoutubeDL(ydl_opts) as ydl:  # type: ignore[arg-type]
-                ydl.download([video_url])
-            success_count += 1
-            progress.update(overall_task, advance=1)
-            progress.remove_task(current_task_id)
+            return idle_ydls.get_nowait()
+        except queue.Empty:
+            ydl_opts = get_ydl_opts(output_dir)
+            ydl_opts["progress_hooks"].append(download_progress_hook)
+            if remuxer is not None:
+                ydl_opts["post_hooks"] = [remuxer.submit]
+            new_ydl = YoutubeDL(ydl_opts)  # type: ignore[arg-type]
+            created_ydls.append(new_ydl)
+            return new_ydl
+
+    def _download_one(video_url: str) -> bool:
+        # Space the downloads of each worker by delay with jitter, counting the
+        # time spent downloading (the first download starts immediately)
+        last_start = getattr(local, "last_start", None)
+        if last_start is not None:
+            sleep_time = delay + random.uniform(0, jitter)
+            sleep_time -= time.monotonic() - last_start
+            if sleep_time > 0:
+                logger.debug(f"Waiting {sleep_time:.1f}s before next download...")
+                if cancelled.wait(sleep_time):
+                    return False
+        local.last_start = time.monotonic()
+
+        task_id = None
+        video_id = None
+        worker_ydl = None
+        try:
+            task_id = progress.add_task(
+                f"[cyan]Downloading {escape(video_url)}", start=False
+            )
+            worker_ydl = _acquire_ydl()
+            # Extract once and feed the result straight to processing, so the info
+            # is available here without a second extractor run
+            info = worker_ydl.extract_info(video_url, download=False, process=False)
+            if info is None:
+                raise RuntimeError("no video information was extracted")
+            if info.get("title"):
+                progress.update(
+                    task_id, description=f"[cyan]Downloading {escape(info['title'])}"
+                )
+            video_id = info.get("id")
+            if video_id:
+                with progress_lock:
+                    progress_states[video_id] = _ProgressState(task_id)
+            if cancelled.is_set():
+                return False
+            worker_ydl.process_ie_result(info, download=True)
+            if video_id:
+                try:
+                    with index_lock:
+                        _append_to_index(index_path, [video_id])
+                except OSError as e:
+                    logger.warning(f"Could not record {video_id} in video index: {e}")
+            return True
         except Exception as e:
-            logger.warning(f"Failed to download video {video_url}: {e}")
-            failed_urls.append(video_url)
+            if not cancelled.is_set():
+                logger.warning(f"Failed to download video {video_url}: {e}")
+            return False
+        finally:
+            if worker_ydl is not None:
+                idle_ydls.put(worker_ydl)
+            if video_id:
+                with progress_lock:
+                    progress_states.pop(video_id, None)
             progress.update(overall_task, advance=1)
-            progress.remove_task(current_task_id)
+            if task_id is not None:
+                progress.remove_task(task_id)
 
-        # Add delay with jitter between downloads (skip after last video)
-        if i < len(video_urls) - 1:
-            sleep_time = delay + random.uniform(0, jitter)
-            logger.debug(f"Waiting {sleep_time:.1f}s before next download...")
-            time.sleep(sleep_time)
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        futures = {
+            executor.submit(_download_one, video_url): video_url
+            for video_url in video_urls
+        }
+        for future in as_completed(futures):
+            if future.result():
+                success_count += 1
+            else:
+                failed_urls.append(futures[future])
+    except BaseException:
+        # On Ctrl-C, drop the queued URLs and abort the running downloads. Wait
+        # for the workers to exit so their YoutubeDL instances can be closed
+        cancelled.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+        raise
+    else:
+        executor.shutdown()
+    finally:
+        for created_ydl in created_ydls:
+            created_ydl.close()
+        if remuxer is not None:
+            logger.debug("Waiting for remuxing to finish...")
+            remuxer.close()
 
     return DownloadResult(
         success_count=success_count,